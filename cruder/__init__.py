@@ -40,7 +40,7 @@ __email__ = "phil.massyn@icloud.com"
 
 from .views import CRUDView, crud_view
 from .forms import CRUDForm, render_form
-from .templates import render_list
+from .templates import render_list, iter_list
 
 __all__ = [
     'CRUDView',
@@ -48,4 +48,5 @@ __all__ = [
     'CRUDForm',
     'render_form',
     'render_list',
+    'iter_list',
 ]
\ No newline at end of file
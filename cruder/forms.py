@@ -2,10 +2,47 @@
 Form generation and rendering for Django models
 """
 
+from functools import lru_cache
 from django import forms
 from django.db import models
 from django.template import Template, Context
-from .frameworks import get_framework
+from .frameworks import get_framework_instance
+
+
+# HTML templates for the form wrapper, rendered with str.format()
+FORM_OPEN_TMPL = '''
+    <form action="{action}" method="{method}" class="{cls}" novalidate>
+        {csrf}
+        '''
+FORM_CLOSE_TMPL = '''
+        <div class="d-grid gap-2 d-md-flex justify-content-md-end">
+            <button type="submit" class="{submit_cls}">
+                {submit_text}
+            </button>
+            <a href="#" class="{cancel_cls}">Cancel</a>
+        </div>
+    </form>
+    '''
+
+# HTML input types for Django model field classes
+FIELD_TYPE_BY_CLASS = {
+    models.CharField: 'text',
+    models.TextField: 'textarea',
+    models.EmailField: 'email',
+    models.URLField: 'url',
+    models.IntegerField: 'number',
+    models.PositiveIntegerField: 'number',
+    models.FloatField: 'number',
+    models.DecimalField: 'number',
+    models.BooleanField: 'checkbox',
+    models.DateField: 'date',
+    models.DateTimeField: 'datetime-local',
+    models.TimeField: 'time',
+    models.FileField: 'file',
+    models.ImageField: 'file',
+    models.ForeignKey: 'select',
+    models.ManyToManyField: 'select',
+}
 
 
 class CRUDForm(forms.ModelForm):
@@ -46,6 +83,12 @@ def create_model_form(model_class, framework='bootstrap', exclude_fields=None):
     return DynamicCRUDForm
 
 
+@lru_cache(maxsize=None)
+def _form_class_cache(model_class, framework, exclude_fields):
+    """Build the form class for a model once per framework and excluded-field tuple"""
+    return create_model_form(model_class, framework, list(exclude_fields) if exclude_fields else None)
+
+
 def render_form(model_class, instance=None, framework='bootstrap', exclude_fields=None, action='', method='POST'):
     """
     Render a complete form for a Django model
@@ -61,90 +104,89 @@ def render_form(model_class, instance=None, framework='bootstrap', exclude_field
     Returns:
         HTML string of the complete form
     """
-    framework_class = get_framework(framework)()
-    form_class = create_model_form(model_class, framework, exclude_fields)
+    framework_class = get_framework_instance(framework)
+    form_class = _form_class_cache(model_class, framework, tuple(exclude_fields or ()))
     form = form_class(instance=instance)
     
     # Generate form fields HTML
     fields_html = []
+    field_map = _model_field_map(model_class)
     for field_name, field in form.fields.items():
-        try:
-            model_field = model_class._meta.get_field(field_name)
-            field_type = get_field_type(model_field)
-            
-            # Get field value if instance exists
-            field_value = ''
-            if instance:
-                try:
-                    field_value = getattr(instance, field_name, '')
-                    if field_value is None:
-                        field_value = ''
-                except:
-                    field_value = ''
-            
-            # Create a field object with proper attributes
-            field_obj = type('Field', (), {
-                'name': field_name,
-                'label': field.label or field_name.replace('_', ' ').title(),
-                'value': field_value,
-                'required': field.required,
-                'help_text': getattr(model_field, 'help_text', None)
-            })()
-            
-            field_html = framework_class.get_form_field_html(
-                field_obj, 
-                field_type=field_type,
-                help_text=getattr(model_field, 'help_text', None)
-            )
-            fields_html.append(field_html)
-        except Exception as e:
-            # Skip problematic fields
+        model_field = field_map.get(field_name)
+        if model_field is None:
             continue
+        field_type = get_field_type(model_field)
+        
+        # Get field value if instance exists
+        field_value = ''
+        if instance:
+            field_value = getattr(instance, field_name, '')
+            if field_value is None:
+                field_value = ''
+        
+        # Create a field object with proper attributes
+        field_obj = type('Field', (), {
+            'name': field_name,
+            'label': field.label or field_name.replace('_', ' ').title(),
+            'value': field_value,
+            'required': field.required,
+            'help_text': getattr(model_field, 'help_text', None)
+        })()
+        
+        field_html = framework_class.get_form_field_html(
+            field_obj, 
+            field_type=field_type,
+            help_text=getattr(model_field, 'help_text', None)
+        )
+        fields_html.append(field_html)
     
     # Generate complete form HTML
-    form_html = f'''
-    <form action="{action}" method="{method}" class="{framework_class.form_classes["form"]}" novalidate>
-        {"{% csrf_token %}" if method.upper() == 'POST' else ''}
-        {"".join(fields_html)}
-        <div class="d-grid gap-2 d-md-flex justify-content-md-end">
-            <button type="submit" class="{framework_class.button_classes["primary"]}">
-                {"Update" if instance else "Create"}
-            </button>
-            <a href="#" class="{framework_class.button_classes["secondary"]}">Cancel</a>
-        </div>
-    </form>
-    '''
+    form_html = "".join([
+        FORM_OPEN_TMPL.format(
+            action=action,
+            method=method,
+            cls=framework_class.form_classes["form"],
+            csrf="{% csrf_token %}" if method.upper() == 'POST' else '',
+        ),
+        *fields_html,
+        FORM_CLOSE_TMPL.format(
+            submit_cls=framework_class.button_classes["primary"],
+            submit_text="Update" if instance else "Create",
+            cancel_cls=framework_class.button_classes["secondary"],
+        ),
+    ])
     
     return form_html
 
 
+@lru_cache(maxsize=None)
+def _model_field_map(model_class):
+    """Map field names to field objects for a model, built once per model"""
+    return {f.name: f for f in model_class._meta.get_fields()}
+
+
 def get_field_type(model_field):
     """Convert Django model field to HTML input type"""
     # Check for boolean field with choices (should be dropdown)
     if isinstance(model_field, models.BooleanField) and hasattr(model_field, 'choices') and model_field.choices:
         return 'select'
     
-    field_mapping = {
-        models.CharField: 'text',
-        models.TextField: 'textarea',
-        models.EmailField: 'email',
-        models.URLField: 'url',
-        models.IntegerField: 'number',
-        models.PositiveIntegerField: 'number',
-        models.FloatField: 'number',
-        models.DecimalField: 'number',
-        models.BooleanField: 'checkbox',
-        models.DateField: 'date',
-        models.DateTimeField: 'datetime-local',
-        models.TimeField: 'time',
-        models.FileField: 'file',
-        models.ImageField: 'file',
-        models.ForeignKey: 'select',
-        models.ManyToManyField: 'select',
-    }
+    field_class = type(model_field)
+    input_type = FIELD_TYPE_BY_CLASS.get(field_class)
+    if input_type is not None:
+        return input_type
     
-    for field_class, input_type in field_mapping.items():
-        if isinstance(model_field, field_class):
+    # Subclasses of registered field classes
+    return _field_type_for_class(field_class)
+
+
+@lru_cache(maxsize=None)
+def _field_type_for_class(field_class):
+    """Resolve the HTML input type for a model field class"""
+    # Walk the MRO so the most specific registered class wins
+    for klass in field_class.__mro__:
+        input_type = FIELD_TYPE_BY_CLASS.get(klass)
+        if input_type is not None:
             return input_type
     
     return 'text'  # Default fallback
\ No newline at end of file
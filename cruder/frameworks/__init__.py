@@ -2,6 +2,8 @@
 CSS Framework support for Django Cruder
 """
 
+from functools import lru_cache
+
 from .base import BaseFramework
 from .bootstrap import BootstrapFramework
 from .bulma import BulmaFramework
@@ -14,4 +16,15 @@ FRAMEWORKS = {
 
 def get_framework(name='bootstrap'):
     """Get framework class by name"""
-    return FRAMEWORKS.get(name, BootstrapFramework)
\ No newline at end of file
+    return FRAMEWORKS.get(name, BootstrapFramework)
+
+
+@lru_cache(maxsize=None)
+def get_framework_instance(name='bootstrap'):
+    """
+    Get a shared framework instance by name
+
+    Framework classes only hold class-level lookup tables, so a single
+    instance per name can safely be reused across requests and threads.
+    """
+    return get_framework(name)()
\ No newline at end of file
@@ -2,6 +2,53 @@
 Base framework class for CSS framework support
 """
 
+# Translation table for HTML-escaping text in a single str.translate() pass
+_ESC = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+
+# HTML templates shared by all frameworks, rendered with str.format()
+TABLE_OPEN_TMPL = '''
+        <table class="{table_cls}">
+            <thead class="{thead_cls}">
+                <tr class="{tr_cls}">
+                    {headers}
+                </tr>
+            </thead>
+            <tbody class="{tbody_cls}">
+                '''
+TABLE_CLOSE = '''
+            </tbody>
+        </table>
+        '''
+HEADER_TMPL = '<th class="{th_cls}">{header}</th>'
+ROW_TMPL = '<tr class="{tr_cls}">{cells}</tr>'
+CELL_TMPL = '<td class="{td_cls}">{cell}</td>'
+FIELD_INPUT_TMPL = '<input type="{type}" name="{name}" class="{cls}">'
+BUTTON_TMPL = '<{tag} class="{cls}" {href}>{text}</{tag}>'
+
+
+class _KeepMissing(dict):
+    """format_map() mapping that leaves unknown placeholders untouched"""
+    
+    def __missing__(self, key):
+        return '{' + key + '}'
+
+
+def specialize(template, **values):
+    """
+    Partially render a str.format() template
+    
+    Placeholders named in ``values`` are substituted now; all others are kept
+    so the result can be rendered again with the per-call values.
+    """
+    return template.format_map(_KeepMissing(values))
+
+
 class BaseFramework:
     """Base class for CSS framework implementations"""
     
@@ -44,38 +91,58 @@ class BaseFramework:
         'dark': '',
     }
     
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._specialize()
+    
+    @classmethod
+    def _specialize(cls):
+        """Bake this framework's CSS classes into its HTML templates"""
+        table_classes = cls.table_classes
+        cls._header_tmpl = specialize(HEADER_TMPL, th_cls=table_classes["th"])
+        cls._row_tmpl = specialize(ROW_TMPL, tr_cls=table_classes["tr"])
+        cls._cell_tmpl = specialize(CELL_TMPL, td_cls=table_classes["td"])
+        cls._table_open_tmpl = specialize(
+            TABLE_OPEN_TMPL,
+            table_cls=table_classes["table"],
+            thead_cls=table_classes["thead"],
+            tbody_cls=table_classes["tbody"],
+            tr_cls=table_classes["tr"],
+        )
+    
     def get_form_field_html(self, field, field_type='text'):
         """Generate HTML for a form field"""
-        return f'<input type="{field_type}" name="{field.name}" class="{self.form_classes["input"]}">'
+        return FIELD_INPUT_TMPL.format(type=field_type, name=field.name, cls=self.form_classes["input"])
     
     def get_table_html(self, headers, rows):
         """Generate HTML for a data table"""
-        header_html = "".join(f'<th class="{self.table_classes["th"]}">{h}</th>' for h in headers)
-        
-        # Build rows HTML without nested f-strings
-        rows_html = []
-        for row in rows:
-            cells_html = []
-            for cell in row:
-                cells_html.append(f'<td class="{self.table_classes["td"]}">{cell}</td>')
-            row_html = f'<tr class="{self.table_classes["tr"]}">{"".join(cells_html)}</tr>'
-            rows_html.append(row_html)
-        
-        return f'''
-        <table class="{self.table_classes["table"]}">
-            <thead class="{self.table_classes["thead"]}">
-                <tr class="{self.table_classes["tr"]}">
-                    {header_html}
-                </tr>
-            </thead>
-            <tbody class="{self.table_classes["tbody"]}">
-                {"".join(rows_html)}
-            </tbody>
-        </table>
-        '''
+        row_html = self._row
+        return "".join([
+            self._open_table(headers),
+            *(row_html(row) for row in rows),
+            self._close_table(),
+        ])
+    
+    def _open_table(self, headers):
+        """Generate the table opening tags and header row"""
+        header_tmpl = self._header_tmpl
+        header_html = "".join(header_tmpl.format(header=str(h).translate(_ESC)) for h in headers)
+        return self._table_open_tmpl.format(headers=header_html)
+    
+    def _row(self, row):
+        """Generate HTML for a single table row"""
+        cell_tmpl = self._cell_tmpl
+        return self._row_tmpl.format(cells="".join(cell_tmpl.format(cell=cell) for cell in row))
+    
+    def _close_table(self):
+        """Generate the table closing tags"""
+        return TABLE_CLOSE
     
     def get_button_html(self, text, button_type='primary', href=None):
         """Generate HTML for a button"""
         tag = 'a' if href else 'button'
         href_attr = f'href="{href}"' if href else ''
-        return f'<{tag} class="{self.button_classes[button_type]}" {href_attr}>{text}</{tag}>'
\ No newline at end of file
+        return BUTTON_TMPL.format(tag=tag, cls=self.button_classes[button_type], href=href_attr, text=text)
+
+
+BaseFramework._specialize()
\ No newline at end of file
@@ -2,7 +2,44 @@
 Bootstrap 5 framework implementation
 """
 
-from .base import BaseFramework
+from .base import BaseFramework, _ESC, specialize
+
+
+# Form field templates, rendered with str.format()
+TEXTAREA_TMPL = '<textarea class="{cls}" name="{name}" id="id_{name}" {required}>{value}</textarea>'
+INPUT_TMPL = '<input type="{type}" class="{cls}" name="{name}" id="id_{name}" value="{value}" {required}>'
+SELECT_TMPL = '''<select class="{cls}" name="{name}" id="id_{name}" {required}>
+                {options}
+            </select>'''
+BOOLEAN_OPTIONS_TMPL = '''
+                <option value="">Choose...</option>
+                <option value="True" {true_selected}>Yes</option>
+                <option value="False" {false_selected}>No</option>
+                '''
+EMPTY_OPTIONS = '<option value="">Choose...</option>'
+CHECKBOX_TMPL = '''
+            <div class="form-check">
+                <input class="{cls}" type="checkbox" name="{name}" id="id_{name}" {checked}>
+                <label class="form-check-label" for="id_{name}">{label}</label>
+            </div>
+            '''
+FIELD_TMPL = '''
+            <div class="{field_cls}">
+                <label for="id_{name}" class="{label_cls}">{label}</label>
+                {input}
+                {help_text}
+                {errors}
+            </div>
+            '''
+CHECKBOX_FIELD_TMPL = '''
+            <div class="{field_cls}">
+                {input}
+                {help_text}
+                {errors}
+            </div>
+            '''
+HELP_TEXT_TMPL = '<div class="{cls}">{text}</div>'
+ERROR_TMPL = '<div class="{cls}">{text}</div>'
 
 
 class BootstrapFramework(BaseFramework):
@@ -46,6 +83,21 @@ class BootstrapFramework(BaseFramework):
         'dark': 'btn btn-dark',
     }
     
+    @classmethod
+    def _specialize(cls):
+        """Bake this framework's CSS classes into its HTML templates"""
+        super()._specialize()
+        form_classes = cls.form_classes
+        cls._textarea_tmpl = specialize(TEXTAREA_TMPL, cls=form_classes["textarea"])
+        cls._input_tmpl = specialize(INPUT_TMPL, cls=form_classes["input"])
+        cls._select_tmpl = specialize(SELECT_TMPL, cls=form_classes["select"])
+        cls._checkbox_tmpl = specialize(CHECKBOX_TMPL, cls=form_classes["checkbox"])
+        cls._field_tmpl = specialize(
+            FIELD_TMPL, field_cls=form_classes["field"], label_cls=form_classes["label"])
+        cls._checkbox_field_tmpl = specialize(CHECKBOX_FIELD_TMPL, field_cls=form_classes["field"])
+        cls._help_text_tmpl = specialize(HELP_TEXT_TMPL, cls=form_classes["help_text"])
+        cls._error_tmpl = specialize(ERROR_TMPL, cls=form_classes["error"])
+    
     def get_form_field_html(self, field, field_type='text', errors=None, help_text=None):
         """Generate Bootstrap form field HTML"""
         field_name = getattr(field, 'name', field)
@@ -53,50 +105,46 @@ class BootstrapFramework(BaseFramework):
         field_value = getattr(field, 'value', '') or ''
         required = getattr(field, 'required', False)
         
+        required_attr = "required" if required else ""
+        
+        # Escape user-controlled text before it goes into the markup
+        label_html = str(field_label).translate(_ESC)
+        value_html = str(field_value).translate(_ESC)
+        
         # Handle different field types
         if field_type == 'textarea':
-            input_html = f'<textarea class="{self.form_classes["textarea"]}" name="{field_name}" id="id_{field_name}" {"required" if required else ""}>{field_value}</textarea>'
+            input_html = self._textarea_tmpl.format(
+                name=field_name, value=value_html, required=required_attr)
         elif field_type == 'select':
             # Handle boolean fields with choices (like active_client)
             if field_name == 'active_client':
-                options_html = f'''
-                <option value="">Choose...</option>
-                <option value="True" {"selected" if str(field_value) == "True" else ""}>Yes</option>
-                <option value="False" {"selected" if str(field_value) == "False" else ""}>No</option>
-                '''
+                options_html = BOOLEAN_OPTIONS_TMPL.format(
+                    true_selected="selected" if str(field_value) == "True" else "",
+                    false_selected="selected" if str(field_value) == "False" else "",
+                )
             else:
-                options_html = '<option value="">Choose...</option>'
+                options_html = EMPTY_OPTIONS
             
-            input_html = f'''<select class="{self.form_classes["select"]}" name="{field_name}" id="id_{field_name}" {"required" if required else ""}>
-                {options_html}
-            </select>'''
+            input_html = self._select_tmpl.format(
+                name=field_name, options=options_html, required=required_attr)
         elif field_type == 'checkbox':
-            input_html = f'''
-            <div class="form-check">
-                <input class="{self.form_classes["checkbox"]}" type="checkbox" name="{field_name}" id="id_{field_name}" {"checked" if field_value else ""}>
-                <label class="form-check-label" for="id_{field_name}">{field_label}</label>
-            </div>
-            '''
+            input_html = self._checkbox_tmpl.format(
+                name=field_name, label=label_html, checked="checked" if field_value else "")
         else:
-            input_html = f'<input type="{field_type}" class="{self.form_classes["input"]}" name="{field_name}" id="id_{field_name}" value="{field_value}" {"required" if required else ""}>'
+            input_html = self._input_tmpl.format(
+                type=field_type, name=field_name, value=value_html, required=required_attr)
+        
+        help_html = self._help_text_tmpl.format(text=help_text) if help_text else ''
+        errors_html = self._error_tmpl.format(text=errors) if errors else ''
         
         # Build complete field HTML for non-checkbox fields
         if field_type != 'checkbox':
-            field_html = f'''
-            <div class="{self.form_classes["field"]}">
-                <label for="id_{field_name}" class="{self.form_classes["label"]}">{field_label}</label>
-                {input_html}
-                {f'<div class="{self.form_classes["help_text"]}">{help_text}</div>' if help_text else ''}
-                {f'<div class="{self.form_classes["error"]}">{errors}</div>' if errors else ''}
-            </div>
-            '''
+            field_html = self._field_tmpl.format(
+                name=field_name, label=label_html, input=input_html,
+                help_text=help_html, errors=errors_html,
+            )
         else:
-            field_html = f'''
-            <div class="{self.form_classes["field"]}">
-                {input_html}
-                {f'<div class="{self.form_classes["help_text"]}">{help_text}</div>' if help_text else ''}
-                {f'<div class="{self.form_classes["error"]}">{errors}</div>' if errors else ''}
-            </div>
-            '''
+            field_html = self._checkbox_field_tmpl.format(
+                input=input_html, help_text=help_html, errors=errors_html)
         
         return field_html
\ No newline at end of file
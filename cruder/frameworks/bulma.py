@@ -2,7 +2,45 @@
 Bulma CSS framework implementation
 """
 
-from .base import BaseFramework
+from .base import BaseFramework, _ESC, specialize
+
+
+# Form field templates, rendered with str.format()
+TEXTAREA_TMPL = '<textarea class="{cls}" name="{name}" id="id_{name}" {required}>{value}</textarea>'
+INPUT_TMPL = '<input type="{type}" class="{cls}" name="{name}" id="id_{name}" value="{value}" {required}>'
+SELECT_TMPL = '''
+            <div class="select is-fullwidth">
+                <select name="{name}" id="id_{name}" {required}>
+                </select>
+            </div>
+            '''
+CHECKBOX_TMPL = '''
+            <label class="checkbox">
+                <input type="checkbox" name="{name}" id="id_{name}" {checked}>
+                {label}
+            </label>
+            '''
+FIELD_TMPL = '''
+            <div class="{field_cls}">
+                <label class="{label_cls}" for="id_{name}">{label}</label>
+                <div class="control">
+                    {input}
+                </div>
+                {help_text}
+                {errors}
+            </div>
+            '''
+CHECKBOX_FIELD_TMPL = '''
+            <div class="{field_cls}">
+                <div class="control">
+                    {input}
+                </div>
+                {help_text}
+                {errors}
+            </div>
+            '''
+HELP_TEXT_TMPL = '<p class="{cls}">{text}</p>'
+ERROR_TMPL = '<p class="{cls}">{text}</p>'
 
 
 class BulmaFramework(BaseFramework):
@@ -46,6 +84,19 @@ class BulmaFramework(BaseFramework):
         'dark': 'button is-dark',
     }
     
+    @classmethod
+    def _specialize(cls):
+        """Bake this framework's CSS classes into its HTML templates"""
+        super()._specialize()
+        form_classes = cls.form_classes
+        cls._textarea_tmpl = specialize(TEXTAREA_TMPL, cls=form_classes["textarea"])
+        cls._input_tmpl = specialize(INPUT_TMPL, cls=form_classes["input"])
+        cls._field_tmpl = specialize(
+            FIELD_TMPL, field_cls=form_classes["field"], label_cls=form_classes["label"])
+        cls._checkbox_field_tmpl = specialize(CHECKBOX_FIELD_TMPL, field_cls=form_classes["field"])
+        cls._help_text_tmpl = specialize(HELP_TEXT_TMPL, cls=form_classes["help_text"])
+        cls._error_tmpl = specialize(ERROR_TMPL, cls=form_classes["error"])
+    
     def get_form_field_html(self, field, field_type='text', errors=None, help_text=None):
         """Generate Bulma form field HTML"""
         field_name = getattr(field, 'name', field)
@@ -53,47 +104,36 @@ class BulmaFramework(BaseFramework):
         field_value = getattr(field, 'value', '') or ''
         required = getattr(field, 'required', False)
         
+        required_attr = "required" if required else ""
+        
+        # Escape user-controlled text before it goes into the markup
+        label_html = str(field_label).translate(_ESC)
+        value_html = str(field_value).translate(_ESC)
+        
         # Handle different field types
         if field_type == 'textarea':
-            input_html = f'<textarea class="{self.form_classes["textarea"]}" name="{field_name}" id="id_{field_name}" {"required" if required else ""}>{field_value}</textarea>'
+            input_html = self._textarea_tmpl.format(
+                name=field_name, value=value_html, required=required_attr)
         elif field_type == 'select':
-            input_html = f'''
-            <div class="select is-fullwidth">
-                <select name="{field_name}" id="id_{field_name}" {"required" if required else ""}>
-                </select>
-            </div>
-            '''
+            input_html = SELECT_TMPL.format(name=field_name, required=required_attr)
         elif field_type == 'checkbox':
-            input_html = f'''
-            <label class="checkbox">
-                <input type="checkbox" name="{field_name}" id="id_{field_name}" {"checked" if field_value else ""}>
-                {field_label}
-            </label>
-            '''
+            input_html = CHECKBOX_TMPL.format(
+                name=field_name, label=label_html, checked="checked" if field_value else "")
         else:
-            input_html = f'<input type="{field_type}" class="{self.form_classes["input"]}" name="{field_name}" id="id_{field_name}" value="{field_value}" {"required" if required else ""}>'
+            input_html = self._input_tmpl.format(
+                type=field_type, name=field_name, value=value_html, required=required_attr)
+        
+        help_html = self._help_text_tmpl.format(text=help_text) if help_text else ''
+        errors_html = self._error_tmpl.format(text=errors) if errors else ''
         
         # Build complete field HTML for non-checkbox fields
         if field_type != 'checkbox':
-            field_html = f'''
-            <div class="{self.form_classes["field"]}">
-                <label class="{self.form_classes["label"]}" for="id_{field_name}">{field_label}</label>
-                <div class="control">
-                    {input_html}
-                </div>
-                {f'<p class="{self.form_classes["help_text"]}">{help_text}</p>' if help_text else ''}
-                {f'<p class="{self.form_classes["error"]}">{errors}</p>' if errors else ''}
-            </div>
-            '''
+            field_html = self._field_tmpl.format(
+                name=field_name, label=label_html, input=input_html,
+                help_text=help_html, errors=errors_html,
+            )
         else:
-            field_html = f'''
-            <div class="{self.form_classes["field"]}">
-                <div class="control">
-                    {input_html}
-                </div>
-                {f'<p class="{self.form_classes["help_text"]}">{help_text}</p>' if help_text else ''}
-                {f'<p class="{self.form_classes["error"]}">{errors}</p>' if errors else ''}
-            </div>
-            '''
+            field_html = self._checkbox_field_tmpl.format(
+                input=input_html, help_text=help_html, errors=errors_html)
         
         return field_html
\ No newline at end of file
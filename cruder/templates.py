@@ -2,14 +2,121 @@
 Template rendering for list views and data tables
 """
 
-from django.db import models
+import datetime
+from functools import lru_cache
+from operator import attrgetter
+from django.db import connections, models
 from django.core.paginator import Paginator
-from .frameworks import get_framework
+from django.utils.functional import cached_property
+from django.utils.translation import get_language
+from .frameworks import get_framework_instance
+from .frameworks.base import _ESC, specialize
+from .forms import _model_field_map
+
+
+# HTML templates for the list view, rendered with str.format()
+LIST_CHROME_TMPL = '''
+    <div class="crud-list-view">
+        <div class="d-flex justify-content-between align-items-center mb-3">
+            <h2>{title}</h2>
+            {add_button}
+        </div>
+        '''
+LIST_SUMMARY_TMPL = '''
+        {search}
+        
+        <div class="mb-3">
+            <small class="text-muted">
+                Showing {start}-{end} of {count} items
+            </small>
+        </div>
+        '''
+LIST_CLOSE = '''
+    </div>
+    '''
+RESPONSIVE_OPEN_TMPL = '''
+    <div class="{cls}">
+        '''
+RESPONSIVE_CLOSE = '''
+    </div>
+    '''
+ACTIONS_TMPL = '''
+        <div class="btn-group btn-group-sm" role="group">
+            {buttons}
+        </div>
+        '''
+NO_ACTIONS_HTML = '<span class="text-muted">No actions available</span>'
+VIEW_BUTTON_TMPL = '<a href="{view_url}" class="{view_cls} btn-sm">View</a>'
+EDIT_BUTTON_TMPL = '<a href="{edit_url}" class="{edit_cls} btn-sm">Edit</a>'
+DELETE_BUTTON_TMPL = '<a href="{delete_url}" class="{delete_cls} btn-sm">Delete</a>'
+ADD_BUTTON_TMPL = '<a href="{url}" class="{cls}">Add New</a>'
+
+PAGINATION_OPEN = '''
+    <nav aria-label="Page navigation">
+        <ul class="pagination justify-content-center">
+    '''
+PAGINATION_CLOSE = '''
+        </ul>
+    </nav>
+    '''
+PREVIOUS_PAGE_TMPL = '''
+            <li class="page-item">
+                <a class="page-link" href="?page={page}">Previous</a>
+            </li>
+        '''
+NEXT_PAGE_TMPL = '''
+            <li class="page-item">
+                <a class="page-link" href="?page={page}">Next</a>
+            </li>
+        '''
+PREVIOUS_DISABLED_HTML = '<li class="page-item disabled"><span class="page-link">Previous</span></li>'
+NEXT_DISABLED_HTML = '<li class="page-item disabled"><span class="page-link">Next</span></li>'
+CURRENT_PAGE_TMPL = '<li class="page-item active"><span class="page-link">{page}</span></li>'
+PAGE_LINK_TMPL = '<li class="page-item"><a class="page-link" href="?page={page}">{page}</a></li>'
+
+SEARCH_TMPL = '''
+    <div class="row mb-3">
+        <div class="col-md-6">
+            <form method="get" class="d-flex">
+                <input type="text" name="search" class="{input_cls} me-2" 
+                       placeholder="{placeholder}" value="{value}">
+                <button type="submit" class="{button_cls}">Search</button>
+            </form>
+        </div>
+    </div>
+    '''
+
+
+def _fmt_datetime(value):
+    return value.strftime('%Y-%m-%d %H:%M')
+
+
+def _fmt_bool(value):
+    return 'Yes' if value else 'No'
+
+
+def _fmt_none(value):
+    return '-'
+
+
+def _fmt_many(manager):
+    return ', '.join(str(related) for related in manager.all()) or '-'
+
+
+# Table cell formatters keyed on the exact value type; anything else uses str()
+_FORMATTERS = {
+    datetime.datetime: _fmt_datetime,
+    datetime.date: _fmt_datetime,
+    datetime.time: _fmt_datetime,
+    bool: _fmt_bool,
+    type(None): _fmt_none,
+}
 
 
 def render_list(model_class, queryset=None, framework='bootstrap', fields=None, 
                 per_page=25, page=1, search_fields=None, search_query=None, 
-                base_url=None, url_pattern=None, permissions=None, search_field=None):
+                base_url=None, url_pattern=None, permissions=None, search_field=None,
+                count=None, search_backend=None, search_config='english'):
     """
     Render a list/table view for a Django model
     
@@ -23,15 +130,72 @@ def render_list(model_class, queryset=None, framework='bootstrap', fields=None,
         search_fields: List of fields to search in (OR logic)
         search_query: Search query string
         search_field: Single field to search in (deprecated, use search_fields)
+        count: Known or estimated total number of objects. Skips the
+            ``COUNT(*)`` query the paginator would otherwise run.
+        search_backend: Set to ``'fulltext'`` to use PostgreSQL full-text
+            search instead of ``icontains`` lookups (PostgreSQL only).
+        search_config: Text search configuration for full-text search. Must
+            match the one used by the search index.
     
     Returns:
         Dict with HTML and pagination info
     """
-    framework_class = get_framework(framework)()
+    chunks, page_obj = _list_parts(
+        model_class, queryset=queryset, framework=framework, fields=fields,
+        per_page=per_page, page=page, search_fields=search_fields,
+        search_query=search_query, base_url=base_url, permissions=permissions,
+        search_field=search_field, count=count, search_backend=search_backend,
+        search_config=search_config,
+    )
+    
+    return {
+        'html': "".join(chunks),
+        'page_obj': page_obj,
+        'paginator': page_obj.paginator,
+        'total_count': page_obj.paginator.count,
+    }
+
+
+def iter_list(*args, **kwargs):
+    """
+    Render a list/table view for a Django model as a stream of HTML chunks
+    
+    Takes the same arguments as ``render_list``. The query and pagination run
+    up front; rows are rendered as the returned iterator is consumed, so it
+    can be passed straight to ``StreamingHttpResponse`` to start sending the
+    page before every row has been formatted.
+    
+    Returns:
+        Iterator of HTML strings
+    """
+    chunks, page_obj = _list_parts(*args, **kwargs)
+    return chunks
+
+
+def _list_parts(model_class, queryset=None, framework='bootstrap', fields=None,
+                per_page=25, page=1, search_fields=None, search_query=None,
+                base_url=None, url_pattern=None, permissions=None, search_field=None,
+                count=None, search_backend=None, search_config='english'):
+    """Run the list query and return the HTML chunk iterator with the current page"""
+    framework_class = get_framework_instance(framework)
+    
+    # Get field information and headers (cached per model and field list)
+    fields, headers = _resolve_fields_and_headers(
+        model_class, tuple(fields) if fields is not None else None)
+    headers = list(headers)
+    headers.append('Actions')  # Add actions column
     
-    # Get queryset
+    # Get queryset, loading only the displayed columns when they are all
+    # plain database columns and fetching displayed relations up front
+    select_fields, prefetch_fields = _related_fields(model_class, fields)
     if queryset is None:
         queryset = model_class.objects.all()
+        if _all_concrete(model_class, fields):
+            queryset = queryset.only(*fields)
+        if select_fields:
+            queryset = queryset.select_related(*select_fields)
+        if prefetch_fields:
+            queryset = queryset.prefetch_related(*prefetch_fields)
     
     # Handle backward compatibility for search_field
     if search_field and not search_fields:
@@ -39,92 +203,15 @@ def render_list(model_class, queryset=None, framework='bootstrap', fields=None,
     
     # Apply search filter with OR logic across multiple fields
     if search_fields and search_query:
-        from django.db.models import Q
-        q_objects = Q()
-        for field in search_fields:
-            q_objects |= Q(**{f"{field}__icontains": search_query})
-        queryset = queryset.filter(q_objects)
-    
-    # Get field information
-    if fields is None:
-        fields = [f.name for f in model_class._meta.get_fields() 
-                 if not f.name.endswith('_set') and f.name not in ['id']]
-    
-    # Generate headers
-    headers = []
-    for field_name in fields:
-        try:
-            field = model_class._meta.get_field(field_name)
-            verbose_name = getattr(field, 'verbose_name', field_name.replace('_', ' ').title())
-            headers.append(verbose_name)
-        except:
-            headers.append(field_name.replace('_', ' ').title())
-    
-    headers.append('Actions')  # Add actions column
+        queryset = _apply_search(queryset, search_fields, search_query, search_backend, search_config)
     
     # Paginate queryset
-    paginator = Paginator(queryset, per_page)
+    if count is None:
+        paginator = Paginator(queryset, per_page)
+    else:
+        paginator = _FastPaginator(queryset, per_page, count)
     page_obj = paginator.get_page(page)
     
-    # Generate table rows
-    rows = []
-    for obj in page_obj:
-        row = []
-        for field_name in fields:
-            try:
-                value = getattr(obj, field_name)
-                # Format the value based on field type
-                if hasattr(value, 'strftime'):  # DateTime fields
-                    value = value.strftime('%Y-%m-%d %H:%M')
-                elif isinstance(value, bool):
-                    value = 'Yes' if value else 'No'
-                elif value is None:
-                    value = '-'
-                row.append(str(value))
-            except:
-                row.append('-')
-        
-        # Add action buttons with proper URLs based on permissions
-        obj_id = getattr(obj, 'pk', getattr(obj, 'id', ''))
-        if base_url:
-            view_url = f"{base_url}{obj_id}/"
-            edit_url = f"{base_url}{obj_id}/edit/"
-            delete_url = f"{base_url}{obj_id}/delete/"
-        else:
-            view_url = f"?pk={obj_id}&action=view"
-            edit_url = f"?pk={obj_id}&action=edit"
-            delete_url = f"?pk={obj_id}&action=delete"
-        
-        # Build action buttons based on permissions
-        action_buttons = []
-        
-        if not permissions or permissions.get('can_read', True):
-            action_buttons.append(f'<a href="{view_url}" class="{framework_class.button_classes["info"]} btn-sm">View</a>')
-        
-        if not permissions or permissions.get('can_update', True):
-            action_buttons.append(f'<a href="{edit_url}" class="{framework_class.button_classes["warning"]} btn-sm">Edit</a>')
-        
-        if not permissions or permissions.get('can_delete', True):
-            action_buttons.append(f'<a href="{delete_url}" class="{framework_class.button_classes["danger"]} btn-sm">Delete</a>')
-        
-        actions_html = f'''
-        <div class="btn-group btn-group-sm" role="group">
-            {"".join(action_buttons)}
-        </div>
-        ''' if action_buttons else '<span class="text-muted">No actions available</span>'
-        row.append(actions_html)
-        rows.append(row)
-    
-    # Generate table HTML
-    table_html = framework_class.get_table_html(headers, rows)
-    
-    # Wrap table in responsive container
-    responsive_table = f'''
-    <div class="{framework_class.table_classes["table_responsive"]}">
-        {table_html}
-    </div>
-    '''
-    
     # Generate pagination HTML
     pagination_html = generate_pagination_html(page_obj, framework_class)
     
@@ -132,43 +219,200 @@ def render_list(model_class, queryset=None, framework='bootstrap', fields=None,
     search_html = generate_search_html(search_fields, search_query, framework_class)
     
     # Generate complete list view HTML
+    can_create = not permissions or permissions.get('can_create', True)
+    chrome_html = _list_chrome(model_class, framework, base_url, can_create, get_language())
+    summary_html = LIST_SUMMARY_TMPL.format(
+        search=search_html,
+        start=page_obj.start_index(),
+        end=page_obj.end_index(),
+        count=paginator.count,
+    )
+    
+    def chunks():
+        yield chrome_html
+        yield summary_html
+        # Wrap table in responsive container
+        yield RESPONSIVE_OPEN_TMPL.format(cls=framework_class.table_classes["table_responsive"])
+        yield framework_class._open_table(headers)
+        for row in _iter_rows(fields, page_obj, framework_class.button_classes, permissions, base_url,
+                              prefetch_fields):
+            yield framework_class._row(row)
+        yield framework_class._close_table()
+        yield RESPONSIVE_CLOSE
+        yield pagination_html
+        yield LIST_CLOSE
+    
+    return chunks(), page_obj
+
+
+class _FastPaginator(Paginator):
+    """Paginator that uses a count supplied by the caller instead of querying it"""
+    
+    def __init__(self, object_list, per_page, count):
+        super().__init__(object_list, per_page)
+        self._count = count
+    
+    @cached_property
+    def count(self):
+        return self._count
+
+
+def _apply_search(queryset, search_fields, search_query, search_backend, search_config):
+    """Filter a queryset to the objects matching a search in any of the search fields"""
+    if search_backend == 'fulltext' and connections[queryset.db].vendor == 'postgresql':
+        # Index-backed full-text search, see the GinIndex note in the docs. The
+        # configuration must be given for PostgreSQL to match the index expression.
+        from django.contrib.postgres.search import SearchQuery, SearchVector
+        return queryset.annotate(
+            cruder_search=SearchVector(*search_fields, config=search_config),
+        ).filter(cruder_search=SearchQuery(search_query, config=search_config))
+    
+    from django.db.models import Q
+    q_objects = Q()
+    for field in search_fields:
+        q_objects |= Q(**{f"{field}__icontains": search_query})
+    return queryset.filter(q_objects)
+
+
+@lru_cache(maxsize=256)
+def _resolve_fields_and_headers(model_class, fields):
+    """Resolve the displayed field names and their column headers for a model"""
+    if fields is None:
+        fields = tuple(f.name for f in model_class._meta.get_fields()
+                       if not f.name.endswith('_set') and f.name != 'id')
+    
+    field_map = _model_field_map(model_class)
+    headers = []
+    for field_name in fields:
+        # Reverse relations and non-field attributes have no verbose_name
+        default = field_name.replace('_', ' ').title()
+        headers.append(getattr(field_map.get(field_name), 'verbose_name', default))
+    
+    return fields, tuple(headers)
+
+
+@lru_cache(maxsize=256)
+def _all_concrete(model_class, fields):
+    """Check whether every displayed field is a concrete database column"""
+    field_map = _model_field_map(model_class)
+    return all(getattr(field_map.get(name), 'concrete', False) for name in fields)
+
+
+@lru_cache(maxsize=256)
+def _related_fields(model_class, fields):
+    """Split the displayed relations into select_related and prefetch_related names"""
+    field_map = _model_field_map(model_class)
+    select_fields = []
+    prefetch_fields = []
+    for name in fields:
+        field = field_map.get(name)
+        if isinstance(field, (models.ForeignKey, models.OneToOneField)):
+            select_fields.append(name)
+        elif isinstance(field, models.ManyToManyField):
+            prefetch_fields.append(name)
+    return tuple(select_fields), tuple(prefetch_fields)
+
+
+@lru_cache(maxsize=128)
+def _list_chrome(model_class, framework, base_url, can_create, language):
+    """Render the list title and Add New button, which only vary per model, URL and permission"""
     if base_url:
-        create_url = f"{base_url}create/"
+        create_url = f"{base_url.translate(_ESC)}create/"
     else:
         create_url = "?action=create"
     
     # Add New button based on permissions
     add_button = ''
-    if not permissions or permissions.get('can_create', True):
-        add_button = f'<a href="{create_url}" class="{framework_class.button_classes["primary"]}">Add New</a>'
-        
-    complete_html = f'''
-    <div class="crud-list-view">
-        <div class="d-flex justify-content-between align-items-center mb-3">
-            <h2>{model_class._meta.verbose_name_plural.title()}</h2>
-            {add_button}
-        </div>
+    if can_create:
+        add_button = ADD_BUTTON_TMPL.format(
+            url=create_url, cls=get_framework_instance(framework).button_classes["primary"])
+    
+    # The language is part of the cache key so translated model names are
+    # rendered once per language
+    return LIST_CHROME_TMPL.format(
+        title=str(model_class._meta.verbose_name_plural).title().translate(_ESC),
+        add_button=add_button,
+    )
+
+
+def _iter_rows(fields, page_obj, button_classes, permissions, base_url, many_fields=()):
+    """
+    Yield the formatted table cells, including the actions cell, for each object on a page
+    
+    Columns named in ``many_fields`` hold many-to-many managers and are shown
+    as the list of related objects.
+    """
+    # Permissions are the same for every row, so build the actions cell
+    # template once per page and only fill in the URLs per row
+    action_buttons = []
+    if not permissions or permissions.get('can_read', True):
+        action_buttons.append(VIEW_BUTTON_TMPL)
+    if not permissions or permissions.get('can_update', True):
+        action_buttons.append(EDIT_BUTTON_TMPL)
+    if not permissions or permissions.get('can_delete', True):
+        action_buttons.append(DELETE_BUTTON_TMPL)
+    if action_buttons:
+        actions_tmpl = specialize(
+            ACTIONS_TMPL.format(buttons="".join(action_buttons)),
+            view_cls=button_classes["info"],
+            edit_cls=button_classes["warning"],
+            delete_cls=button_classes["danger"],
+        )
+    else:
+        actions_tmpl = NO_ACTIONS_HTML
+    
+    # Reused for every row; only the URLs change
+    urls = {'view_url': '', 'edit_url': '', 'delete_url': ''}
+    
+    if base_url:
+        base_url = base_url.translate(_ESC)
+    
+    # Fetch all displayed values with one C-level call per row
+    get_values = attrgetter(*fields) if fields else (lambda obj: ())
+    single_field = len(fields) == 1
+    many_indexes = [index for index, name in enumerate(fields) if name in many_fields]
+    
+    for obj in page_obj:
+        try:
+            values = get_values(obj)
+        except Exception:
+            # A field could not be read, so read field by field and show
+            # the unreadable ones as '-'
+            values = tuple(_read_value(obj, name) for name in fields)
+        else:
+            if single_field:
+                values = (values,)
         
-        {search_html}
+        if many_indexes:
+            values = list(values)
+            for index in many_indexes:
+                if values[index] is not None:
+                    values[index] = _fmt_many(values[index])
         
-        <div class="mb-3">
-            <small class="text-muted">
-                Showing {page_obj.start_index()}-{page_obj.end_index()} of {paginator.count} items
-            </small>
-        </div>
+        # Format the values based on their type
+        row = [_FORMATTERS.get(type(value), str)(value).translate(_ESC) for value in values]
         
-        {responsive_table}
+        # Add action buttons with proper URLs
+        obj_id = str(getattr(obj, 'pk', getattr(obj, 'id', ''))).translate(_ESC)
+        if base_url:
+            urls['view_url'] = f"{base_url}{obj_id}/"
+            urls['edit_url'] = f"{base_url}{obj_id}/edit/"
+            urls['delete_url'] = f"{base_url}{obj_id}/delete/"
+        else:
+            urls['view_url'] = f"?pk={obj_id}&action=view"
+            urls['edit_url'] = f"?pk={obj_id}&action=edit"
+            urls['delete_url'] = f"?pk={obj_id}&action=delete"
         
-        {pagination_html}
-    </div>
-    '''
-    
-    return {
-        'html': complete_html,
-        'page_obj': page_obj,
-        'paginator': paginator,
-        'total_count': paginator.count,
-    }
+        row.append(actions_tmpl.format_map(urls))
+        yield row
+
+
+def _read_value(obj, field_name):
+    """Read a single field value, returning None if it cannot be read"""
+    try:
+        return getattr(obj, field_name)
+    except Exception:
+        return None
 
 
 def generate_pagination_html(page_obj, framework_class):
@@ -176,44 +420,31 @@ def generate_pagination_html(page_obj, framework_class):
     if not page_obj.has_other_pages():
         return ''
     
-    pagination_html = '''
-    <nav aria-label="Page navigation">
-        <ul class="pagination justify-content-center">
-    '''
+    parts = [PAGINATION_OPEN]
     
     # Previous page
     if page_obj.has_previous():
-        pagination_html += f'''
-            <li class="page-item">
-                <a class="page-link" href="?page={page_obj.previous_page_number()}">Previous</a>
-            </li>
-        '''
+        parts.append(PREVIOUS_PAGE_TMPL.format(page=page_obj.previous_page_number()))
     else:
-        pagination_html += '<li class="page-item disabled"><span class="page-link">Previous</span></li>'
+        parts.append(PREVIOUS_DISABLED_HTML)
     
     # Page numbers
+    current = page_obj.number
     for num in page_obj.paginator.page_range:
-        if num == page_obj.number:
-            pagination_html += f'<li class="page-item active"><span class="page-link">{num}</span></li>'
+        if num == current:
+            parts.append(CURRENT_PAGE_TMPL.format(page=num))
         else:
-            pagination_html += f'<li class="page-item"><a class="page-link" href="?page={num}">{num}</a></li>'
+            parts.append(PAGE_LINK_TMPL.format(page=num))
     
     # Next page
     if page_obj.has_next():
-        pagination_html += f'''
-            <li class="page-item">
-                <a class="page-link" href="?page={page_obj.next_page_number()}">Next</a>
-            </li>
-        '''
+        parts.append(NEXT_PAGE_TMPL.format(page=page_obj.next_page_number()))
     else:
-        pagination_html += '<li class="page-item disabled"><span class="page-link">Next</span></li>'
+        parts.append(NEXT_DISABLED_HTML)
     
-    pagination_html += '''
-        </ul>
-    </nav>
-    '''
+    parts.append(PAGINATION_CLOSE)
     
-    return pagination_html
+    return "".join(parts)
 
 
 def generate_search_html(search_fields, search_query, framework_class):
@@ -229,14 +460,12 @@ def generate_search_html(search_fields, search_query, framework_class):
     else:
         placeholder = f"Search {', '.join(search_fields[:2])}, and {len(search_fields)-2} more..."
     
-    return f'''
-    <div class="row mb-3">
-        <div class="col-md-6">
-            <form method="get" class="d-flex">
-                <input type="text" name="search" class="{framework_class.form_classes["input"]} me-2" 
-                       placeholder="{placeholder}" value="{search_query or ''}">
-                <button type="submit" class="{framework_class.button_classes["primary"]}">Search</button>
-            </form>
-        </div>
-    </div>
-    '''
\ No newline at end of file
+    placeholder = placeholder.translate(_ESC)
+    search_value = (search_query or '').translate(_ESC)
+    
+    return SEARCH_TMPL.format(
+        input_cls=framework_class.form_classes["input"],
+        button_cls=framework_class.button_classes["primary"],
+        placeholder=placeholder,
+        value=search_value,
+    )
\ No newline at end of file
@@ -2,6 +2,8 @@
 URL helper functions for Django Cruder
 """
 
+import sys
+
 from django.urls import path
 
 
@@ -68,10 +70,17 @@ def crud_urlpatterns(url_prefix, view_func, name_prefix=None):
     if name_prefix is None:
         name_prefix = url_prefix.replace('/', '_').strip('_')
     
+    # URL names are looked up as dict keys by reverse(), so intern them
+    list_name = sys.intern(name_prefix)
+    create_name = sys.intern(f'{name_prefix}_create')
+    detail_name = sys.intern(f'{name_prefix}_detail')
+    edit_name = sys.intern(f'{name_prefix}_edit')
+    delete_name = sys.intern(f'{name_prefix}_delete')
+    
     return [
-        path(f'{url_prefix}/', view_func, name=f'{name_prefix}'),
-        path(f'{url_prefix}/create/', view_func, {'action': 'create'}, name=f'{name_prefix}_create'),
-        path(f'{url_prefix}/<int:pk>/', view_func, {'action': 'view'}, name=f'{name_prefix}_detail'),
-        path(f'{url_prefix}/<int:pk>/edit/', view_func, {'action': 'edit'}, name=f'{name_prefix}_edit'),
-        path(f'{url_prefix}/<int:pk>/delete/', view_func, {'action': 'delete'}, name=f'{name_prefix}_delete'),
-    ]
\ No newline at end of file
+        path(f'{url_prefix}/', view_func, name=list_name),
+        path(f'{url_prefix}/create/', view_func, {'action': 'create'}, name=create_name),
+        path(f'{url_prefix}/<int:pk>/', view_func, {'action': 'view'}, name=detail_name),
+        path(f'{url_prefix}/<int:pk>/edit/', view_func, {'action': 'edit'}, name=edit_name),
+        path(f'{url_prefix}/<int:pk>/delete/', view_func, {'action': 'delete'}, name=delete_name),
+    ]
@@ -2,13 +2,281 @@
 CRUD view classes and wrapper functions for Django models
 """
 
+import hashlib
+import re
+import time
+from functools import lru_cache
+from operator import methodcaller
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib import messages
 from django.http import JsonResponse
 from django.views.generic import View
+from django.urls import NoReverseMatch, Resolver404, resolve, reverse
+from django.utils.translation import get_language
+from django.core.cache import cache
 from django.core.exceptions import PermissionDenied
-from .forms import render_form, create_model_form
-from .templates import render_list
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from .forms import render_form, _form_class_cache, _model_field_map
+from .templates import render_list, _related_fields, _resolve_fields_and_headers
+
+
+# Matches the action suffix of a CRUD URL, e.g. /create/ or /4/edit/
+_LIST_URL_RE = re.compile(r'/(?:create|(?:\d+/)?(?:edit|delete))/?$')
+
+
+def _list_url_for(path):
+    """Get the list view URL for a CRUD action URL"""
+    list_url = _LIST_URL_RE.sub('/', path)
+    return list_url if list_url.endswith('/') else list_url + '/'
+
+
+# CRUD operations and their flag names in the list view's permissions context
+_PERMISSION_KEYS = (
+    ('C', 'can_create'),
+    ('R', 'can_read'),
+    ('U', 'can_update'),
+    ('D', 'can_delete'),
+)
+
+# Operations that modify data, denied in read-only mode
+_CUD_OPS = frozenset(('C', 'U', 'D'))
+
+# Messages raised with PermissionDenied for each CRUD operation
+_DENIED_MESSAGES = {
+    'C': "You don't have permission to create new items.",
+    'R': "You don't have permission to view this content.",
+    'U': "You don't have permission to edit items.",
+    'D': "You don't have permission to delete items.",
+}
+
+# Action dispatch tables: action -> (operation, handler name, takes pk)
+_GET_DISPATCH = {
+    'list': ('R', 'list_view', False),
+    'create': ('C', 'create_view', False),
+    'edit': ('U', 'edit_view', True),
+    'view': ('R', 'detail_view', True),
+    'delete': ('D', 'delete_view', True),
+}
+_POST_DISPATCH = {
+    'create': ('C', 'create_post', False),
+    'edit': ('U', 'edit_post', True),
+    'delete': ('D', 'delete_post', True),
+}
+
+# URL name suffixes given to the non-list routes by crud_urlpatterns()
+_URL_NAME_SUFFIXES = ('_create', '_detail', '_edit', '_delete')
+
+# Resolved list route names, keyed on (view name, view function)
+_list_url_names = {}
+
+
+def _list_url(request, url_name=None):
+    """
+    Get the list view URL to redirect to after a create, edit or delete
+    
+    Reverses ``url_name`` if given. Otherwise the list route name is derived
+    from the current route name (``contacts_edit`` -> ``contacts``, as
+    generated by crud_urlpatterns()), and the path-based fallback is used
+    when neither can be reversed.
+    """
+    match = getattr(request, 'resolver_match', None)
+    if url_name is None and match is not None:
+        url_name = _resolve_list_url_name(match)
+    if url_name:
+        kwargs = {}
+        if match is not None:
+            kwargs = {k: v for k, v in match.kwargs.items() if k not in ('pk', 'action')}
+        try:
+            return reverse(url_name, kwargs=kwargs)
+        except NoReverseMatch:
+            pass
+    return _list_url_for(request.path)
+
+
+def _resolve_list_url_name(match):
+    """Find the list route name for a resolved CRUD route, cached per route"""
+    key = (match.view_name, match.func)
+    if key not in _list_url_names:
+        _list_url_names[key] = _find_list_url_name(match)
+    return _list_url_names[key]
+
+
+def _find_list_url_name(match):
+    if not match.url_name:
+        return None
+    for suffix in _URL_NAME_SUFFIXES:
+        if match.view_name.endswith(suffix):
+            url_name = match.view_name[:-len(suffix)]
+            kwargs = {k: v for k, v in match.kwargs.items() if k not in ('pk', 'action')}
+            try:
+                list_match = resolve(reverse(url_name, kwargs=kwargs))
+            except (NoReverseMatch, Resolver404):
+                return None
+            # Only trust the name if it routes to the same view
+            return url_name if list_match.func is match.func else None
+    return None
+
+
+_strftime = methodcaller('strftime', '%Y-%m-%d %H:%M')
+
+
+def _format_datetime(value):
+    return 'Not set' if value is None else _strftime(value)
+
+
+def _format_bool(value):
+    if value is None:
+        return 'Not set'
+    return 'Yes' if value else 'No'
+
+
+def _format_value(value):
+    return 'Not set' if value is None else value
+
+
+def _format_many(manager):
+    if manager is None:
+        return 'Not set'
+    return ', '.join(str(related) for related in manager.all()) or 'Not set'
+
+
+# Display formatters for detail fields, keyed on the field's internal type
+_DETAIL_FORMATTERS = {
+    'DateTimeField': _format_datetime,
+    'DateField': _format_datetime,
+    'TimeField': _format_datetime,
+    'BooleanField': _format_bool,
+    'NullBooleanField': _format_bool,
+    'ManyToManyField': _format_many,
+}
+
+
+@lru_cache(maxsize=None)
+def _detail_field_specs(model_class):
+    """
+    Describe the fields shown on the detail and delete pages of a model
+    
+    Returns a tuple of (name, label, formatter) entries, built once per model.
+    """
+    specs = []
+    for field in model_class._meta.get_fields():
+        name = field.name
+        if name.endswith('_set') or name == 'id':
+            continue
+        if field.auto_created and not field.concrete:
+            continue  # Reverse relation, no attribute of that name on the object
+        label = getattr(field, 'verbose_name', name.replace('_', ' ').title())
+        internal_type = field.get_internal_type() if hasattr(field, 'get_internal_type') else ''
+        specs.append((name, label, _DETAIL_FORMATTERS.get(internal_type, _format_value)))
+    return tuple(specs)
+
+
+def _list_cache_version_key(model_class):
+    return f'cruder:list-version:{model_class._meta.label_lower}'
+
+
+def _list_cache_version(model_class):
+    """
+    Get the current generation of a model's cached list pages
+    
+    A missing counter starts from the current time, so pages cached under an
+    evicted counter are never picked up again.
+    """
+    key = _list_cache_version_key(model_class)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+# Models whose cached list pages show data from a model, keyed on that model
+_list_cache_dependents = {}
+
+
+def _invalidate_list_cache(sender, **kwargs):
+    """Signal receiver that retires the cached list pages showing the sender's data"""
+    for model_class in _list_cache_dependents.get(sender, ()):
+        try:
+            cache.incr(_list_cache_version_key(model_class))
+        except ValueError:
+            pass  # No counter yet, nothing has been cached
+
+
+def _watch_list_cache(model_class, fields):
+    """
+    Invalidate a model's cached list pages whenever the data they show changes
+    
+    Covers saves and deletes of the model itself and of the models behind its
+    displayed foreign key and many-to-many columns, and changes to those
+    many-to-many relations.
+    """
+    fields, _ = _resolve_fields_and_headers(model_class, tuple(fields) if fields is not None else None)
+    select_fields, prefetch_fields = _related_fields(model_class, fields)
+    field_map = _model_field_map(model_class)
+    
+    senders = {model_class}
+    senders.update(field_map[name].related_model for name in select_fields + prefetch_fields)
+    for sender in senders:
+        _list_cache_dependents.setdefault(sender, set()).add(model_class)
+        post_save.connect(_invalidate_list_cache, sender=sender, dispatch_uid='cruder_list_cache')
+        post_delete.connect(_invalidate_list_cache, sender=sender, dispatch_uid='cruder_list_cache')
+    
+    for name in prefetch_fields:
+        through = field_map[name].remote_field.through
+        _list_cache_dependents.setdefault(through, set()).add(model_class)
+        m2m_changed.connect(_invalidate_list_cache, sender=through, dispatch_uid='cruder_list_cache')
+
+
+def _list_cache_key(options):
+    """
+    Build the cache key for a list page from its render_list() arguments
+    
+    The active language is part of the key, as the cached HTML contains
+    translated titles and column headers.
+    """
+    model_class = options['model_class']
+    digest = hashlib.sha256(repr(sorted(
+        (name, value) for name, value in options.items() if name != 'model_class'
+    )).encode()).hexdigest()
+    return (f'cruder:list:{model_class._meta.label_lower}:{_list_cache_version(model_class)}:'
+            f'{get_language()}:{digest}')
+
+
+class _ModelMetaOption:
+    """
+    Read an option from the view's model._meta on access
+    
+    Fallback for views whose model was not known when _prepare_options()
+    ran, e.g. when ``model`` is assigned after the class is created.
+    """
+    
+    def __init__(self, name):
+        self.name = name
+    
+    def __get__(self, instance, owner):
+        model = owner.model if instance is None else instance.model
+        return getattr(model._meta, self.name)
+
+
+def _prepare_options(target):
+    """
+    Precompute the view configuration that is checked on every request
+    
+    Runs once per view class (and per instance when as_view() is given
+    options): role lists become frozensets and the model's verbose names
+    are read. Models of views with a list cache get their invalidation
+    signals.
+    """
+    if target.permissions:
+        target.permissions = {
+            operation: frozenset(roles) for operation, roles in target.permissions.items()
+        }
+    if target.model is not None:
+        target._verbose_name = target.model._meta.verbose_name
+        target._verbose_name_plural = target.model._meta.verbose_name_plural
+        if target.list_cache_timeout is not None:
+            _watch_list_cache(target.model, target.list_fields)
 
 
 class CRUDView(View):
@@ -23,6 +291,8 @@ class CRUDView(View):
     per_page = 25
     search_fields = None
     search_field = None  # Deprecated, use search_fields
+    search_backend = None  # 'fulltext' for PostgreSQL full-text search
+    search_config = 'english'  # Text search configuration for full-text search
     permission_required = None
     
     # New features
@@ -30,6 +300,23 @@ class CRUDView(View):
     permissions = None      # Dict mapping CRUD operations to required roles/groups
                            # Example: {'C': ['admin', 'editor'], 'U': ['admin'], 'D': ['admin']}
     readonly_mode = False   # If True, entire view is read-only (no C,U,D operations)
+    list_url_name = None    # URL name of the list view, derived from the route if not set
+    select_related_fields = None  # Relations to join when fetching a single object
+    list_cache_timeout = None  # Seconds to cache the list HTML for (default: not cached)
+    
+    # Precomputed by _prepare_options() when the model is known, else read lazily
+    _verbose_name = _ModelMetaOption('verbose_name')
+    _verbose_name_plural = _ModelMetaOption('verbose_name_plural')
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _prepare_options(cls)
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if kwargs:
+            # Options passed to as_view() override the class configuration
+            _prepare_options(self)
     
     def has_crud_permission(self, user, operation):
         """
@@ -42,25 +329,67 @@ class CRUDView(View):
         Returns:
             bool: True if user has permission
         """
-        if self.readonly_mode and operation in ['C', 'U', 'D']:
+        if self.readonly_mode and operation in _CUD_OPS:
             return False
             
         if not self.permissions:
             return True  # No restrictions defined, allow all
             
-        required_roles = self.permissions.get(operation, [])
+        required_roles = self.permissions.get(operation)
         if not required_roles:
             return True  # No roles required for this operation
             
-        # Check if user has any of the required roles/groups
-        user_groups = [group.name for group in user.groups.all()]
-        
-        # Also check if user is superuser
+        # Superusers bypass role checks, so avoid the group query for them
         if user.is_superuser:
             return True
             
-        # Check if user has any of the required roles
-        return any(role in user_groups for role in required_roles)
+        # Check if user has any of the required roles/groups
+        return not self._user_group_names(user).isdisjoint(required_roles)
+    
+    def _user_group_names(self, user):
+        """
+        Get the names of the user's groups
+        
+        The names are queried once and cached on the user object, which
+        Django creates per request, so repeated permission checks while
+        handling a request share a single query. Groups already prefetched
+        on the user (e.g. by middleware) are read without querying again.
+        """
+        group_names = getattr(user, '_cruder_group_names', None)
+        if group_names is None:
+            if 'groups' in getattr(user, '_prefetched_objects_cache', {}):
+                group_names = frozenset(group.name for group in user.groups.all())
+            else:
+                group_names = frozenset(user.groups.values_list('name', flat=True))
+            user._cruder_group_names = group_names
+        return group_names
+    
+    def _all_crud_permissions(self, user):
+        """
+        Check all four CRUD operations for a user in one pass
+        
+        Returns:
+            dict: can_create, can_read, can_update and can_delete flags
+        """
+        permissions = self.permissions or {}
+        readonly_mode = self.readonly_mode
+        is_superuser = user.is_superuser
+        group_names = None
+        
+        result = {}
+        for operation, key in _PERMISSION_KEYS:
+            if readonly_mode and operation in _CUD_OPS:
+                result[key] = False
+                continue
+            required_roles = permissions.get(operation)
+            if not required_roles or is_superuser:
+                result[key] = True
+                continue
+            # Only query the groups once an operation actually needs them
+            if group_names is None:
+                group_names = self._user_group_names(user)
+            result[key] = not group_names.isdisjoint(required_roles)
+        return result
     
     def dispatch(self, request, *args, **kwargs):
         """Check permissions before processing request"""
@@ -70,45 +399,28 @@ class CRUDView(View):
     
     def get(self, request, pk=None, action='list'):
         """Handle GET requests for list, create, edit, view actions"""
-        if action == 'list':
-            if not self.has_crud_permission(request.user, 'R'):
-                raise PermissionDenied("You don't have permission to view this content.")
-            return self.list_view(request)
-        elif action == 'create':
-            if not self.has_crud_permission(request.user, 'C'):
-                raise PermissionDenied("You don't have permission to create new items.")
-            return self.create_view(request)
-        elif action == 'edit' and pk:
-            if not self.has_crud_permission(request.user, 'U'):
-                raise PermissionDenied("You don't have permission to edit items.")
-            return self.edit_view(request, pk)
-        elif action == 'view' and pk:
-            if not self.has_crud_permission(request.user, 'R'):
-                raise PermissionDenied("You don't have permission to view this content.")
-            return self.detail_view(request, pk)
-        elif action == 'delete' and pk:
-            if not self.has_crud_permission(request.user, 'D'):
-                raise PermissionDenied("You don't have permission to delete items.")
-            return self.delete_view(request, pk)
-        else:
-            return self.list_view(request)
+        return self._dispatch_action(_GET_DISPATCH, request, pk, action)
     
     def post(self, request, pk=None, action='create'):
         """Handle POST requests for create, update, delete actions"""
-        if action == 'create':
-            if not self.has_crud_permission(request.user, 'C'):
-                raise PermissionDenied("You don't have permission to create new items.")
-            return self.create_post(request)
-        elif action == 'edit' and pk:
-            if not self.has_crud_permission(request.user, 'U'):
-                raise PermissionDenied("You don't have permission to edit items.")
-            return self.edit_post(request, pk)
-        elif action == 'delete' and pk:
-            if not self.has_crud_permission(request.user, 'D'):
-                raise PermissionDenied("You don't have permission to delete items.")
-            return self.delete_post(request, pk)
-        else:
+        return self._dispatch_action(_POST_DISPATCH, request, pk, action)
+    
+    def _dispatch_action(self, table, request, pk, action):
+        """
+        Run the handler registered for an action after checking permissions
+        
+        Unknown actions, and object actions without a pk, fall back to the
+        list view.
+        """
+        entry = table.get(action)
+        if entry is None or (entry[2] and not pk):
             return self.list_view(request)
+        operation, handler, takes_pk = entry
+        if not self.has_crud_permission(request.user, operation):
+            raise PermissionDenied(_DENIED_MESSAGES[operation])
+        if takes_pk:
+            return getattr(self, handler)(request, pk)
+        return getattr(self, handler)(request)
     
     def list_view(self, request):
         """Display list of model objects"""
@@ -122,48 +434,86 @@ class CRUDView(View):
         else:
             base_url = current_url + '/'
             
+        # Merge the deprecated search_field into search_fields
+        if self.search_fields:
+            search_fields = tuple(self.search_fields)
+        elif self.search_field:
+            search_fields = (self.search_field,)
+        else:
+            search_fields = ()
+        
         # Check permissions for action buttons
-        permissions_context = {
-            'can_create': self.has_crud_permission(request.user, 'C'),
-            'can_read': self.has_crud_permission(request.user, 'R'),
-            'can_update': self.has_crud_permission(request.user, 'U'),
-            'can_delete': self.has_crud_permission(request.user, 'D'),
-        }
+        permissions_context = self._all_crud_permissions(request.user)
         
-        list_data = render_list(
+        list_options = dict(
             model_class=self.model,
             framework=self.framework,
             fields=self.list_fields,
             per_page=self.per_page,
             page=page,
-            search_fields=self.search_fields,
-            search_field=self.search_field,  # For backward compatibility
+            search_fields=search_fields,
             search_query=search_query,
+            search_backend=self.search_backend,
+            search_config=self.search_config,
             base_url=base_url,
             permissions=permissions_context
         )
+        if self.list_cache_timeout is None:
+            list_data = render_list(**list_options)
+        else:
+            list_data = self._cached_list(list_options)
         
         context = {
             'list_html': list_data['html'],
             'page_obj': list_data['page_obj'],
             'total_count': list_data['total_count'],
-            'model_name': self.model._meta.verbose_name,
-            'model_name_plural': self.model._meta.verbose_name_plural,
+            'model_name': self._verbose_name,
+            'model_name_plural': self._verbose_name_plural,
             'permissions': permissions_context,
         }
         
         template = self.template_name or 'cruder/list.html'
         return render(request, template, context)
     
+    def _cached_list(self, list_options):
+        """
+        Render the list through Django's cache framework
+        
+        Only the HTML and row count are cached, so ``page_obj`` is None when
+        a page is served from the cache.
+        """
+        key = _list_cache_key(list_options)
+        cached = cache.get(key)
+        if cached is not None:
+            html, total_count = cached
+            return {'html': html, 'page_obj': None, 'total_count': total_count}
+        list_data = render_list(**list_options)
+        cache.set(key, (list_data['html'], list_data['total_count']), self.list_cache_timeout)
+        return list_data
+    
+    def get_object(self, pk):
+        """Fetch the object for a detail, edit or delete request, or raise Http404"""
+        queryset = self.model.objects.all()
+        if self.select_related_fields:
+            queryset = queryset.select_related(*self.select_related_fields)
+        return get_object_or_404(queryset, pk=pk)
+    
+    def get_list_url(self, request):
+        """Get the list view URL to redirect to after a successful action"""
+        return _list_url(request, self.list_url_name)
+    
+    def get_form_class(self):
+        """Get the model form class, built once per model, framework and excluded fields"""
+        return _form_class_cache(self.model, self.framework, tuple(self.exclude_fields or ()))
+    
     def create_view(self, request):
         """Display create form"""
-        from .forms import create_model_form
-        form_class = create_model_form(self.model, self.framework, self.exclude_fields)
+        form_class = self.get_form_class()
         form = form_class()
         
         context = {
             'form': form,
-            'model_name': self.model._meta.verbose_name,
+            'model_name': self._verbose_name,
             'action': 'Create',
             'framework': self.framework,
             'readonly_fields': self.readonly_fields or [],
@@ -175,30 +525,19 @@ class CRUDView(View):
     
     def create_post(self, request):
         """Handle create form submission"""
-        form_class = create_model_form(self.model, self.framework, self.exclude_fields)
+        form_class = self.get_form_class()
         form = form_class(request.POST, request.FILES)
         
         if form.is_valid():
             obj = form.save()
-            messages.success(request, f"{self.model._meta.verbose_name} created successfully!")
+            messages.success(request, f"{self._verbose_name} created successfully!")
             # Redirect back to list view
-            current_path = request.path
-            if '/create/' in current_path:
-                list_url = current_path.replace('/create/', '/')
-            elif current_path.endswith('/create'):
-                list_url = current_path.replace('/create', '/')
-            elif '/edit/' in current_path:
-                list_url = current_path.split('/edit/')[0] + '/'
-            elif '/delete/' in current_path:
-                list_url = current_path.split('/delete/')[0] + '/'
-            else:
-                list_url = current_path if current_path.endswith('/') else current_path + '/'
-            return redirect(list_url)
+            return redirect(self.get_list_url(request))
         else:
             # Re-render form with errors
             context = {
                 'form': form,
-                'model_name': self.model._meta.verbose_name,
+                'model_name': self._verbose_name,
                 'action': 'Create',
                 'errors': form.errors,
             }
@@ -207,15 +546,14 @@ class CRUDView(View):
     
     def edit_view(self, request, pk):
         """Display edit form"""
-        obj = get_object_or_404(self.model, pk=pk)
-        from .forms import create_model_form
-        form_class = create_model_form(self.model, self.framework, self.exclude_fields)
+        obj = self.get_object(pk)
+        form_class = self.get_form_class()
         form = form_class(instance=obj)
         
         context = {
             'form': form,
             'object': obj,
-            'model_name': self.model._meta.verbose_name,
+            'model_name': self._verbose_name,
             'action': 'Edit',
             'framework': self.framework,
             'readonly_fields': self.readonly_fields or [],
@@ -227,32 +565,21 @@ class CRUDView(View):
     
     def edit_post(self, request, pk):
         """Handle edit form submission"""
-        obj = get_object_or_404(self.model, pk=pk)
-        form_class = create_model_form(self.model, self.framework, self.exclude_fields)
+        obj = self.get_object(pk)
+        form_class = self.get_form_class()
         form = form_class(request.POST, request.FILES, instance=obj)
         
         if form.is_valid():
             obj = form.save()
-            messages.success(request, f"{self.model._meta.verbose_name} updated successfully!")
+            messages.success(request, f"{self._verbose_name} updated successfully!")
             # Redirect back to list view
-            current_path = request.path
-            if '/create/' in current_path:
-                list_url = current_path.replace('/create/', '/')
-            elif current_path.endswith('/create'):
-                list_url = current_path.replace('/create', '/')
-            elif '/edit/' in current_path:
-                list_url = current_path.split('/edit/')[0] + '/'
-            elif '/delete/' in current_path:
-                list_url = current_path.split('/delete/')[0] + '/'
-            else:
-                list_url = current_path if current_path.endswith('/') else current_path + '/'
-            return redirect(list_url)
+            return redirect(self.get_list_url(request))
         else:
             # Re-render form with errors
             context = {
                 'form': form,
                 'object': obj,
-                'model_name': self.model._meta.verbose_name,
+                'model_name': self._verbose_name,
                 'action': 'Edit',
                 'errors': form.errors,
             }
@@ -261,37 +588,12 @@ class CRUDView(View):
     
     def detail_view(self, request, pk):
         """Display object details"""
-        obj = get_object_or_404(self.model, pk=pk)
-        
-        # Get field information for template
-        fields_data = []
-        for field in self.model._meta.get_fields():
-            if not field.name.endswith('_set') and field.name != 'id':
-                try:
-                    field_name = field.name
-                    field_label = getattr(field, 'verbose_name', field_name.replace('_', ' ').title())
-                    field_value = getattr(obj, field_name, None)
-                    
-                    # Format the value
-                    if hasattr(field_value, 'strftime'):  # DateTime fields
-                        field_value = field_value.strftime('%Y-%m-%d %H:%M')
-                    elif isinstance(field_value, bool):
-                        field_value = 'Yes' if field_value else 'No'
-                    elif field_value is None:
-                        field_value = 'Not set'
-                    
-                    fields_data.append({
-                        'name': field_name,
-                        'label': field_label,
-                        'value': field_value
-                    })
-                except:
-                    continue
+        obj = self.get_object(pk)
         
         context = {
             'object': obj,
-            'model_name': self.model._meta.verbose_name,
-            'fields_data': fields_data,
+            'model_name': self._verbose_name,
+            'fields_data': self._field_display_rows(obj),
         }
         
         template = self.template_name or 'cruder/detail.html'
@@ -299,62 +601,32 @@ class CRUDView(View):
     
     def delete_view(self, request, pk):
         """Display delete confirmation"""
-        obj = get_object_or_404(self.model, pk=pk)
-        
-        # Get field information for template (same as detail view)
-        fields_data = []
-        for field in self.model._meta.get_fields():
-            if not field.name.endswith('_set') and field.name != 'id':
-                try:
-                    field_name = field.name
-                    field_label = getattr(field, 'verbose_name', field_name.replace('_', ' ').title())
-                    field_value = getattr(obj, field_name, None)
-                    
-                    # Format the value
-                    if hasattr(field_value, 'strftime'):  # DateTime fields
-                        field_value = field_value.strftime('%Y-%m-%d %H:%M')
-                    elif isinstance(field_value, bool):
-                        field_value = 'Yes' if field_value else 'No'
-                    elif field_value is None:
-                        field_value = 'Not set'
-                    
-                    fields_data.append({
-                        'name': field_name,
-                        'label': field_label,
-                        'value': field_value
-                    })
-                except:
-                    continue
+        obj = self.get_object(pk)
         
         context = {
             'object': obj,
-            'model_name': self.model._meta.verbose_name,
-            'fields_data': fields_data,
+            'model_name': self._verbose_name,
+            'fields_data': self._field_display_rows(obj),
         }
         
         template = self.template_name or 'cruder/delete.html'
         return render(request, template, context)
     
+    def _field_display_rows(self, obj):
+        """Get the formatted field rows shown on the detail and delete pages"""
+        return [
+            {'name': name, 'label': label, 'value': formatter(getattr(obj, name, None))}
+            for name, label, formatter in _detail_field_specs(self.model)
+        ]
+    
     def delete_post(self, request, pk):
         """Handle delete confirmation"""
-        obj = get_object_or_404(self.model, pk=pk)
+        obj = self.get_object(pk)
         obj_name = str(obj)
         obj.delete()
-        messages.success(request, f"{self.model._meta.verbose_name} '{obj_name}' deleted successfully!")
+        messages.success(request, f"{self._verbose_name} '{obj_name}' deleted successfully!")
         # Redirect back to list view
-        current_path = request.path
-        # For /app/contacts/4/delete/ -> /app/contacts/
-        if '/delete/' in current_path:
-            # Split on /delete/ and take the first part, then remove the ID
-            base_path = current_path.split('/delete/')[0]  # /app/contacts/4
-            path_parts = base_path.rstrip('/').split('/')  # ['', 'app', 'contacts', '4']
-            if path_parts[-1].isdigit():  # Remove ID if present
-                list_url = '/'.join(path_parts[:-1]) + '/'  # /app/contacts/
-            else:
-                list_url = base_path + '/'
-        else:
-            list_url = current_path if current_path.endswith('/') else current_path + '/'
-        return redirect(list_url)
+        return redirect(self.get_list_url(request))
 
 
 def crud_view(model_class, framework='bootstrap', **kwargs):
@@ -378,8 +650,16 @@ def crud_view(model_class, framework='bootstrap', **kwargs):
                 
             Search & Pagination:
                 search_fields (list): Fields to enable search across (OR logic).
+                search_backend (str): Set to 'fulltext' to use PostgreSQL
+                    full-text search instead of icontains lookups.
+                search_config (str): Text search configuration for full-text
+                    search, matching the search index. Default: 'english'.
                 per_page (int): Items per page for pagination. Default: 25.
                 
+            Queries:
+                select_related_fields (list): Relations to join when fetching a
+                    single object, e.g. those used by the model's __str__.
+                
             Permissions:
                 permissions (dict): Role-based permissions mapping.
                     Example: {'C': ['admin'], 'U': ['admin'], 'D': ['admin']}
@@ -387,6 +667,11 @@ def crud_view(model_class, framework='bootstrap', **kwargs):
                 
             Templates:
                 template_name (str): Custom template to use instead of defaults.
+                
+            URLs:
+                list_url_name (str): URL name of the list view to redirect to
+                    after create, edit and delete. Derived from the
+                    crud_urlpatterns() route names when not given.
     
     Returns:
         function: A Django view function that handles all CRUD operations.
@@ -422,18 +707,44 @@ def crud_view(model_class, framework='bootstrap', **kwargs):
         The returned view function expects three parameters: request, pk (optional), 
         and action (defaults to 'list'). The action parameter determines which 
         CRUD operation to perform: 'list', 'create', 'view', 'edit', or 'delete'.
+        
+        Create views once at module level (e.g. ``contact_crud = crud_view(Contact)``)
+        rather than inside a view function. Calls with the same model, framework and
+        options return the same cached view, so per-request calls stay cheap.
     """
-    class DynamicCRUDView(CRUDView):
-        model = model_class
-    
-    # Set framework and other attributes after class creation
-    DynamicCRUDView.framework = framework
+    try:
+        key = (model_class, framework, _freeze(kwargs))
+        hash(key)
+    except TypeError:
+        # Options that cannot be used as a cache key
+        return _build_view(model_class, framework, kwargs)
     
-    # Override any provided kwargs
-    for key, value in kwargs.items():
-        setattr(DynamicCRUDView, key, value)
-    
-    return DynamicCRUDView.as_view()
+    view = _view_cache.get(key)
+    if view is None:
+        view = _view_cache.setdefault(key, _build_view(model_class, framework, kwargs))
+    return view
+
+
+# Views built by crud_view(), keyed on the model, framework and frozen options
+_view_cache = {}
+
+
+def _build_view(model_class, framework, options):
+    """Build a CRUDView subclass for a model and return its view function"""
+    attrs = {'model': model_class, 'framework': framework}
+    attrs.update(options)
+    return type('DynamicCRUDView', (CRUDView,), attrs).as_view()
+
+
+def _freeze(value):
+    """Convert nested option values (dicts, lists, sets) into hashable equivalents"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    return value
 
 
 def render_crud_list(model_class, request, framework='bootstrap', **kwargs):
@@ -490,7 +801,7 @@ def render_crud_form(model_class, request, pk=None, framework='bootstrap', **kwa
         instance = get_object_or_404(model_class, pk=pk)
     
     if request.method == 'POST':
-        form_class = create_model_form(model_class, framework)
+        form_class = _form_class_cache(model_class, framework, ())
         form = form_class(request.POST, request.FILES, instance=instance)
         
         if form.is_valid():
@@ -498,18 +809,7 @@ def render_crud_form(model_class, request, pk=None, framework='bootstrap', **kwa
             action = "updated" if instance else "created"
             messages.success(request, f"{model_class._meta.verbose_name} {action} successfully!")
             # Redirect back to list view
-            current_path = request.path
-            if '/create/' in current_path:
-                list_url = current_path.replace('/create/', '/')
-            elif current_path.endswith('/create'):
-                list_url = current_path.replace('/create', '/')
-            elif '/edit/' in current_path:
-                list_url = current_path.split('/edit/')[0] + '/'
-            elif '/delete/' in current_path:
-                list_url = current_path.split('/delete/')[0] + '/'
-            else:
-                list_url = current_path if current_path.endswith('/') else current_path + '/'
-            return redirect(list_url)
+            return redirect(_list_url(request))
     
     form_html = render_form(
         model_class=model_class,
@@ -0,0 +1,75 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import translation
+
+from cruder.views import _list_cache_key
+
+from .testapp.models import Author, Book, Tag
+
+
+class ListCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.author = Author.objects.create(name='Frank Herbert')
+        self.book = Book.objects.create(title='Dune', author=self.author)
+
+    def assertRenders(self):
+        """Request the list page, asserting it was rendered rather than served from the cache"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/books/')
+        self.assertTrue(queries, 'expected the list to be rendered')
+        return response
+
+    def assertCached(self):
+        """Request the list page, asserting it was served from the cache"""
+        with self.assertNumQueries(0):
+            return self.client.get('/books/')
+
+    def test_second_request_is_served_from_the_cache(self):
+        first = self.assertRenders()
+        second = self.assertCached()
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.content, first.content)
+
+    def test_page_obj_is_none_on_a_cache_hit(self):
+        self.assertIsNotNone(self.assertRenders().context['page_obj'])
+        response = self.assertCached()
+        self.assertIsNone(response.context['page_obj'])
+        self.assertEqual(response.context['total_count'], 1)
+
+    def test_save_invalidates(self):
+        self.assertRenders()
+        Book.objects.create(title='Children of Dune', author=self.author)
+        self.assertContains(self.assertRenders(), 'Children of Dune')
+
+    def test_delete_invalidates(self):
+        self.assertRenders()
+        self.book.delete()
+        self.assertNotContains(self.assertRenders(), 'Dune')
+
+    def test_saving_a_displayed_related_object_invalidates(self):
+        self.assertRenders()
+        self.author.name = 'F. Herbert'
+        self.author.save()
+        self.assertContains(self.assertRenders(), 'F. Herbert')
+
+    def test_changing_a_displayed_many_to_many_relation_invalidates(self):
+        self.assertRenders()
+        self.book.tags.add(Tag.objects.create(name='classic'))
+        self.assertContains(self.assertRenders(), 'classic')
+
+    def test_languages_are_cached_separately(self):
+        options = {'model_class': Book, 'page': 1}
+        with translation.override('en'):
+            english_key = _list_cache_key(options)
+        with translation.override('de'):
+            german_key = _list_cache_key(options)
+        self.assertNotEqual(english_key, german_key)
+
+        with translation.override('en'):
+            self.assertRenders()
+            self.assertCached()
+        with translation.override('de'):
+            self.assertRenders()
@@ -0,0 +1,32 @@
+from unittest import mock
+
+from django.db import connections
+from django.test import TestCase
+
+from cruder.templates import _apply_search
+
+from .testapp.models import Book
+
+
+class FullTextSearchTests(TestCase):
+    def search_sql(self, **kwargs):
+        # The full-text branch only runs on PostgreSQL; the SQL it builds
+        # can still be compiled on the test database
+        with mock.patch.object(connections['default'], 'vendor', 'postgresql'):
+            queryset = _apply_search(Book.objects.all(), ['title'], 'dune', 'fulltext', **kwargs)
+        return str(queryset.query)
+
+    def test_vector_and_query_use_the_search_config(self):
+        sql = self.search_sql(search_config='english')
+        self.assertIn('to_tsvector(english::regconfig', sql)
+        self.assertIn('plainto_tsquery(english::regconfig', sql)
+
+    def test_custom_search_config(self):
+        sql = self.search_sql(search_config='german')
+        self.assertIn('to_tsvector(german::regconfig', sql)
+        self.assertIn('plainto_tsquery(german::regconfig', sql)
+
+    def test_other_databases_use_icontains(self):
+        queryset = _apply_search(Book.objects.all(), ['title'], 'dune', 'fulltext', 'english')
+        self.assertNotIn('to_tsvector', str(queryset.query))
+        self.assertIn('LIKE', str(queryset.query))
@@ -0,0 +1,8 @@
+from cruder import crud_view
+from cruder.urls import crud_urlpatterns
+
+from .testapp.models import Book
+
+book_crud = crud_view(Book, list_fields=['title', 'author', 'tags'], list_cache_timeout=60)
+
+urlpatterns = crud_urlpatterns('books', book_crud)